@@ -3,6 +3,7 @@ SQLite 数据访问层。
 封装所有数据库连接管理和 CRUD 操作，作为唯一数据源。
 """
 
+import functools
 import json
 import logging
 import os
@@ -11,25 +12,65 @@ import sqlite3
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
+try:
+    import orjson
+except ImportError:  # orjson 为可选依赖，未安装时回退到标准库 json
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 _DB_PATH = "data/app.db"
 _connection: Optional[sqlite3.Connection] = None
 
 
+def _json_dumps(obj: Any) -> str:
+    """JSON 列序列化：优先 orjson（C 实现），未安装时用 json.dumps(ensure_ascii=False)
+
+    两条路径读回（_json_loads）的结果一致：中文原样保存、非 str 的 key 转成字符串、
+    datetime 等非 JSON 类型都抛 TypeError（OPT_PASSTHROUGH_DATETIME 关掉 orjson 的原生支持）。
+    与标准库仍有的差异：
+    - 输出是紧凑格式（没有 ", " / ": " 里的空格），只影响落库文本，不影响读回的值
+    - NaN / Infinity 写成 null（标准库写出非法 JSON 的 NaN）
+    - UUID 会被序列化为字符串（标准库抛 TypeError），orjson 没有选项关闭
+    JSON 列的数据都来自请求体解析出的 dict / list，不会出现后两种值。
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        ).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False)
+
+
+def _json_loads(text: str) -> Any:
+    """JSON 列反序列化（orjson.JSONDecodeError 是 json.JSONDecodeError 的子类）"""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+_UPPER_RE = re.compile(r"([A-Z])")
+
+
+# 列名集合是固定的，每行每个 key 都要转换一次，缓存转换结果
+@functools.lru_cache(maxsize=256)
+def _camel_key(key: str) -> str:
+    parts = key.split("_")
+    return parts[0] + "".join(p.capitalize() for p in parts[1:])
+
+
+@functools.lru_cache(maxsize=256)
+def _snake_key(key: str) -> str:
+    return _UPPER_RE.sub(r"_\1", key).lower()
+
+
 def _to_camel(row: dict) -> dict:
     """snake_case → camelCase"""
-    def convert(key: str) -> str:
-        parts = key.split("_")
-        return parts[0] + "".join(p.capitalize() for p in parts[1:])
-    return {convert(k): v for k, v in row.items()}
+    return {_camel_key(k): v for k, v in row.items()}
 
 
 def _to_snake(data: dict) -> dict:
     """camelCase → snake_case"""
-    def convert(key: str) -> str:
-        return re.sub(r"([A-Z])", r"_\1", key).lower()
-    return {convert(k): v for k, v in data.items()}
+    return {_snake_key(k): v for k, v in data.items()}
 
 
 def get_connection() -> sqlite3.Connection:
@@ -271,7 +312,7 @@ def insert_message(msg: dict) -> dict:
     data = _to_snake(msg)
     # Serialize JSON fields
     if "sources" in data and not isinstance(data["sources"], str):
-        data["sources"] = json.dumps(data["sources"], ensure_ascii=False)
+        data["sources"] = _json_dumps(data["sources"])
     try:
         with conn:
             conn.execute(
@@ -281,7 +322,7 @@ def insert_message(msg: dict) -> dict:
             )
         # Return with deserialized sources
         result = dict(data)
-        result["sources"] = json.loads(result.get("sources", "[]"))
+        result["sources"] = _json_loads(result.get("sources", "[]"))
         return _to_camel(result)
     except sqlite3.IntegrityError as e:
         logger.warning("Message insertion failed: %s", e)
@@ -300,7 +341,7 @@ def get_messages(plan_id: str) -> List[dict]:
     results = []
     for r in rows:
         d = dict(r)
-        d["sources"] = json.loads(d.get("sources") or "[]")
+        d["sources"] = _json_loads(d.get("sources") or "[]")
         results.append(_to_camel(d))
     return results
 
@@ -327,7 +368,7 @@ def insert_material(mat: dict) -> dict:
     conn = get_connection()
     data = _to_snake(mat)
     if "extra_data" in data and not isinstance(data["extra_data"], str):
-        data["extra_data"] = json.dumps(data["extra_data"], ensure_ascii=False)
+        data["extra_data"] = _json_dumps(data["extra_data"])
     try:
         with conn:
             conn.execute(
@@ -336,7 +377,7 @@ def insert_material(mat: dict) -> dict:
                 data,
             )
         result = dict(data)
-        result["extra_data"] = json.loads(result.get("extra_data") or "{}")
+        result["extra_data"] = _json_loads(result.get("extra_data") or "{}")
         return _to_camel(result)
     except sqlite3.IntegrityError as e:
         logger.warning("Material insertion failed: %s", e)
@@ -355,7 +396,7 @@ def get_materials(plan_id: str) -> List[dict]:
     results = []
     for r in rows:
         d = dict(r)
-        d["extra_data"] = json.loads(d.get("extra_data") or "{}")
+        d["extra_data"] = _json_loads(d.get("extra_data") or "{}")
         results.append(_to_camel(d))
     return results
 
@@ -381,7 +422,7 @@ def get_material_extra_data(material_id: str) -> Optional[dict]:
             "SELECT extra_data FROM materials WHERE id = ?", (material_id,)
         ).fetchone()
         if row and row["extra_data"]:
-            return json.loads(row["extra_data"])
+            return _json_loads(row["extra_data"])
         return None
     except (sqlite3.Error, json.JSONDecodeError) as e:
         logger.error("Database error: %s", e)
@@ -394,7 +435,7 @@ def update_material_extra_data(material_id: str, extra_data: dict) -> bool:
         with conn:
             cur = conn.execute(
                 "UPDATE materials SET extra_data = ? WHERE id = ?",
-                (json.dumps(extra_data, ensure_ascii=False), material_id),
+                (_json_dumps(extra_data), material_id),
             )
         return cur.rowcount > 0
     except sqlite3.Error as e:
@@ -453,7 +494,7 @@ def upsert_progress(plan_id: str, days: list[dict]) -> None:
                 d = _to_snake(day)
                 tasks = d.get("tasks", [])
                 if not isinstance(tasks, str):
-                    tasks = json.dumps(tasks, ensure_ascii=False)
+                    tasks = _json_dumps(tasks)
                 conn.execute(
                     """INSERT OR REPLACE INTO progress (plan_id, day_number, title, completed, tasks)
                        VALUES (?, ?, ?, ?, ?)""",
@@ -487,7 +528,7 @@ def get_progress(plan_id: str) -> List[dict]:
     results = []
     for r in rows:
         d = dict(r)
-        d["tasks"] = json.loads(d.get("tasks") or "[]")
+        d["tasks"] = _json_loads(d.get("tasks") or "[]")
         d["completed"] = bool(d["completed"])
         results.append(_to_camel(d))
     return results
@@ -524,7 +565,7 @@ def update_progress_tasks(plan_id: str, day_number: int, tasks: list[dict]) -> b
         with conn:
             cur = conn.execute(
                 "UPDATE progress SET tasks = ? WHERE plan_id = ? AND day_number = ?",
-                (json.dumps(tasks, ensure_ascii=False), plan_id, day_number),
+                (_json_dumps(tasks), plan_id, day_number),
             )
         return cur.rowcount > 0
     except sqlite3.Error as e:
@@ -650,7 +691,7 @@ def upsert_learner_profile(profile: dict) -> dict:
     conn = get_connection()
     data = _to_snake(profile)
     if "extra" in data and not isinstance(data["extra"], str):
-        data["extra"] = json.dumps(data["extra"], ensure_ascii=False)
+        data["extra"] = _json_dumps(data["extra"])
     now = datetime.now(timezone.utc).isoformat()
     data.setdefault("created_at", now)
     data.setdefault("extra", "{}")
@@ -667,7 +708,7 @@ def upsert_learner_profile(profile: dict) -> dict:
                 data,
             )
         result = dict(data)
-        result["extra"] = json.loads(result.get("extra") or "{}")
+        result["extra"] = _json_loads(result.get("extra") or "{}")
         return _to_camel(result)
     except sqlite3.Error as e:
         logger.error("Database error: %s", e)
@@ -682,7 +723,7 @@ def get_learner_profile(plan_id: str) -> Optional[dict]:
     if not row:
         return None
     d = dict(row)
-    d["extra"] = json.loads(d.get("extra") or "{}")
+    d["extra"] = _json_loads(d.get("extra") or "{}")
     return _to_camel(d)
 
 
@@ -690,9 +731,9 @@ def insert_search_history(entry: dict) -> dict:
     conn = get_connection()
     data = _to_snake(entry)
     if "platforms" in data and not isinstance(data["platforms"], str):
-        data["platforms"] = json.dumps(data["platforms"], ensure_ascii=False)
+        data["platforms"] = _json_dumps(data["platforms"])
     if "results" in data and not isinstance(data["results"], str):
-        data["results"] = json.dumps(data["results"], ensure_ascii=False)
+        data["results"] = _json_dumps(data["results"])
     if "status" not in data:
         data["status"] = "done"
     try:
@@ -703,8 +744,8 @@ def insert_search_history(entry: dict) -> dict:
                 data,
             )
         result = dict(data)
-        result["platforms"] = json.loads(result.get("platforms") or "[]")
-        result["results"] = json.loads(result.get("results") or "[]")
+        result["platforms"] = _json_loads(result.get("platforms") or "[]")
+        result["results"] = _json_loads(result.get("results") or "[]")
         return _to_camel(result)
     except sqlite3.IntegrityError as e:
         logger.warning("Search history insertion failed: %s", e)
@@ -723,8 +764,8 @@ def get_search_history(plan_id: str, limit: int = 20) -> List[dict]:
     results = []
     for r in rows:
         d = dict(r)
-        d["platforms"] = json.loads(d.get("platforms") or "[]")
-        d["results"] = json.loads(d.get("results") or "[]")
+        d["platforms"] = _json_loads(d.get("platforms") or "[]")
+        d["results"] = _json_loads(d.get("results") or "[]")
         results.append(_to_camel(d))
     return results
 
@@ -734,9 +775,9 @@ def update_search_history(entry_id: str, patch: dict) -> Optional[dict]:
     conn = get_connection()
     data = _to_snake(patch)
     if "results" in data and not isinstance(data["results"], str):
-        data["results"] = json.dumps(data["results"], ensure_ascii=False)
+        data["results"] = _json_dumps(data["results"])
     if "platforms" in data and not isinstance(data["platforms"], str):
-        data["platforms"] = json.dumps(data["platforms"], ensure_ascii=False)
+        data["platforms"] = _json_dumps(data["platforms"])
 
     allowed = {"results", "result_count", "status"}
     sets = []
@@ -760,8 +801,8 @@ def update_search_history(entry_id: str, patch: dict) -> Optional[dict]:
         if not row:
             return None
         d = dict(row)
-        d["platforms"] = json.loads(d.get("platforms") or "[]")
-        d["results"] = json.loads(d.get("results") or "[]")
+        d["platforms"] = _json_loads(d.get("platforms") or "[]")
+        d["results"] = _json_loads(d.get("results") or "[]")
         return _to_camel(d)
     except sqlite3.Error as e:
         logger.error("Database error: %s", e)
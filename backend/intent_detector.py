@@ -4,6 +4,7 @@ IntentDetector — 从聊天消息中检测 Studio 工具触发意图
 通过关键词子串匹配检测用户是否想要重新生成某个 Studio 工具的内容。
 """
 
+import re
 from typing import Dict, List, Optional, Tuple
 
 TRIGGER_KEYWORDS: Dict[str, List[str]] = {
@@ -14,6 +15,12 @@ TRIGGER_KEYWORDS: Dict[str, List[str]] = {
     "mind-map": ["更新思维导图", "重新生成导图", "刷新导图"],
 }
 
+# 每个工具的关键词预编译为一个 alternation，保持 TRIGGER_KEYWORDS 的优先顺序
+_TRIGGER_PATTERNS: List[Tuple[str, "re.Pattern[str]"]] = [
+    (tool_type, re.compile("|".join(map(re.escape, keywords))))
+    for tool_type, keywords in TRIGGER_KEYWORDS.items()
+]
+
 
 def detect_studio_trigger(message: str) -> Tuple[bool, Optional[str]]:
     """检测消息中是否包含 Studio 工具触发关键词。
@@ -21,7 +28,7 @@ def detect_studio_trigger(message: str) -> Tuple[bool, Optional[str]]:
     Returns:
         (是否触发, 工具类型) — 未触发时返回 (False, None)
     """
-    for tool_type, keywords in TRIGGER_KEYWORDS.items():
-        if any(kw in message for kw in keywords):
+    for tool_type, pattern in _TRIGGER_PATTERNS:
+        if pattern.search(message):
             return (True, tool_type)
     return (False, None)
@@ -10,9 +10,7 @@ import os
 import asyncio
 import logging
 import platform
-
-from dotenv import load_dotenv
-load_dotenv()
+import time
 
 # Windows 上确保事件循环支持子进程（Playwright 需要）
 # 必须在任何事件循环创建之前设置
@@ -25,7 +23,12 @@ logging.basicConfig(
     datefmt="%H:%M:%S",
 )
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _PROJECT_ROOT not in sys.path:  # uvicorn --reload / pytest 已配置 pythonpath 时不重复插入
+    sys.path.insert(0, _PROJECT_ROOT)
+
+from src.core.config import load_env_once
+load_env_once()
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -36,6 +39,21 @@ from backend import database
 app = FastAPI(title="XLearning API", version="0.1.0")
 
 
+def _warmup() -> None:
+    """预热重型依赖：路由里的 src 模块都是按需导入的，
+    启动后在后台线程先导入一遍，避免第一位用户的请求承担 langchain / chromadb 的导入耗时。"""
+    logger = logging.getLogger("backend.main")
+    t_start = time.perf_counter()
+    try:
+        import src.rag.engine  # noqa: F401  (chromadb / langchain / dashscope)
+        import src.agents.tutor  # noqa: F401
+        import src.providers.openai_compatible  # noqa: F401
+    except Exception as e:
+        logger.warning(f"预热失败（不影响服务，首个请求时再加载）: {e}")
+        return
+    logger.info(f"依赖预热完成，用时 {(time.perf_counter() - t_start) * 1000:.0f}ms")
+
+
 @app.on_event("startup")
 async def _startup():
     """启动时初始化数据库并检查事件循环类型。"""
@@ -51,6 +69,8 @@ async def _startup():
 
     # 检查事件循环类型
     loop = asyncio.get_running_loop()
+    # 后台预热，不阻塞启动
+    loop.run_in_executor(None, _warmup)
     loop_type = type(loop).__name__
     logger.info(f"事件循环类型: {loop_type}")
     if platform.system() == "Windows" and "Proactor" not in loop_type:
@@ -15,6 +15,7 @@ from dataclasses import dataclass
 from langsmith import traceable
 
 from backend import database
+from src.core.config import WEEKDAYS
 
 logger = logging.getLogger(__name__)
 
@@ -244,8 +245,7 @@ class PromptBuilder:
         # 6. role_instruction as system_prompt with current time
         from datetime import datetime
         now = datetime.now()
-        weekdays = ["星期一", "星期二", "星期三", "星期四", "星期五", "星期六", "星期日"]
-        time_str = f"{now.strftime('%Y年%m月%d日 %H:%M:%S')} {weekdays[now.weekday()]}"
+        time_str = f"{now.strftime('%Y年%m月%d日 %H:%M:%S')} {WEEKDAYS[now.weekday()]}"
         system_prompt = f"【系统提示：当前真实时间是 {time_str}】\n\n{template.role_instruction}"
         
         return (user_prompt, system_prompt)
@@ -382,110 +382,6 @@ class PromptBuilder:
 
         return "\n".join(lines) if lines else ""
 
-    def _build_study_guide_instruction(
-        self,
-        all_days: list[dict],
-        rag_context: str,
-        profile_text: str,
-        chat_history: list[dict],
-        current_day_number: int | None,
-    ) -> str:
-        """动态拼接 study-guide 的 generation_instruction。
-
-        根据上下文丰富程度（材料/画像/进度）拼出明确的场景指令，
-        LLM 不需要自己做条件判断。
-        """
-        parts: list[str] = []
-
-        parts.append("请基于以下上下文，生成一份个性化的宏观学习路线图。")
-
-        # --- 核心原则 ---
-        parts.append("\n## 核心原则\n")
-
-        # 材料角色
-        if rag_context:
-            parts.append(
-                "1. **材料为骨架**：路线图必须围绕提供的学习材料展开，"
-                "材料覆盖的知识点是学习范围的核心。不要脱离材料自由发挥无关内容。"
-            )
-        else:
-            parts.append(
-                "1. **无材料模式**：当前没有学习材料，请基于学习者画像或对话主题"
-                "生成通用路线图。在开头明确提示「建议上传学习材料以获得更精准的路线图」。"
-            )
-
-        # 聊天历史角色
-        principle_num = 2
-        if chat_history:
-            parts.append(
-                f"{principle_num}. **聊天历史为线索**：从对话历史中提取用户提过的问题、困惑点、"
-                "感兴趣的方向，在路线图相关知识点旁用 ⚠️ 标注，并给出针对性建议。"
-            )
-            principle_num += 1
-
-        # 画像角色
-        if profile_text:
-            parts.append(
-                f"{principle_num}. **画像为约束**：根据学习者的目的、水平、"
-                "可用时间调整路线图的深度、广度和节奏。"
-            )
-        else:
-            parts.append(
-                f"{principle_num}. **无画像模式**：当前没有学习者画像，"
-                "生成通用深度的路线图。在开头提示「建议填写学习者画像"
-                "（学习目的、当前水平、可用时间）以获得个性化定制」。"
-            )
-
-        # --- 场景判断（Python 层已判断，直接给 LLM 明确指令）---
-        completed_days = [d for d in all_days if d.get("completed")]
-        total_days = len(all_days)
-
-        if total_days > 0 and len(completed_days) > 0:
-            parts.append(
-                f"\n## 当前场景：迭代更新（已完成 {len(completed_days)}/{total_days} 天）\n"
-                "这是一次路线图更新，不是从零开始。\n"
-                "- 对已完成内容做简要回顾和掌握度评估\n"
-                "- 重点展开未完成部分\n"
-                "- 根据学习过程中暴露的问题调整后续路线"
-            )
-        else:
-            parts.append(
-                "\n## 当前场景：首次生成\n"
-                "生成完整的从零开始路线图。"
-            )
-
-        # 当前天数重点
-        if current_day_number is not None:
-            current_day = _find_day(all_days, current_day_number)
-            if current_day and current_day.get("title"):
-                parts.append(
-                    f"\n当前学习进度在 Day {current_day_number}：{current_day['title']}，"
-                    "请重点覆盖该主题相关的知识点。"
-                )
-
-        # --- 路线图结构要求 ---
-        parts.append(
-            "\n## 路线图结构要求\n"
-            "路线图必须包含以下阶段（根据材料内容调整具体名称）：\n"
-            "- **入门基础**：前置知识和核心概念入门\n"
-            "- **核心深入**：材料的主体内容，系统性掌握\n"
-            "- **进阶应用**：综合运用、项目实践或高级主题\n"
-            "每个阶段必须有一个**里程碑**：明确描述「学完这个阶段后，你应该能做到什么」。"
-        )
-
-        # --- 补充资源推荐 ---
-        parts.append(
-            "\n## 补充资源推荐\n"
-            "在路线图末尾推荐 3-5 个高质量学习资源，优先推荐：\n"
-            "- 官方文档（如 Python 官方教程、React 官方文档）\n"
-            "- 经典书籍（如《CSAPP》《SICP》《设计模式》等领域公认经典）\n"
-            "- 知名系统性教程（如 freeCodeCamp、MIT OCW、Coursera 热门课程）\n"
-            "- 权威技术博客或系列文章（如 MDN Web Docs、Real Python）\n"
-            "只推荐你确信真实存在的资源，不要编造链接或虚构书名。"
-        )
-
-        return "\n".join(parts)
-
     def _build_rag_query(self, content_type: str, ctx) -> str:
         """根据工具类型和学习上下文构造 RAG 查询词。"""
         all_days = getattr(ctx, "allDays", None) or []
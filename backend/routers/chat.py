@@ -112,8 +112,8 @@ def _build_material_context(plan_id: str, material_ids: List[str], user_message:
     # 2) 上传文件材料：通过 RAG 按需检索
     if upload_ids and user_message:
         try:
-            from src.rag import RAGEngine
-            rag = RAGEngine(collection_name=f"plan_{plan_id}")
+            from src.rag import get_rag_engine
+            rag = get_rag_engine(f"plan_{plan_id}")
             k = min(3 * len(upload_ids), 10)
             results = rag.retrieve(
                 query=user_message,
@@ -216,7 +216,7 @@ async def _generate_sse(plan_id: str, message: str, history: List[dict], materia
             logger.warning(f"[chat] Studio trigger failed: {e}")
 
     chunk_count = 0
-    full_response = ""
+    response_parts: list[str] = []  # 流式分片先收集，结束时一次 join，避免逐 token 字符串拼接
     src_payload = []
     t_start = time.perf_counter()
 
@@ -241,7 +241,7 @@ async def _generate_sse(plan_id: str, message: str, history: List[dict], materia
         ):
             if chunk:
                 chunk_count += 1
-                full_response += chunk
+                response_parts.append(chunk)
                 data = json.dumps({"type": "chunk", "content": chunk}, ensure_ascii=False)
                 yield f"data: {data}\n\n"
                 await asyncio.sleep(0)  # 让出事件循环，保证 SSE 实时推送
@@ -274,6 +274,7 @@ async def _generate_sse(plan_id: str, message: str, history: List[dict], materia
     finally:
         t_end = time.perf_counter()
         duration_ms = round((t_end - t_start) * 1000, 1)
+        full_response = "".join(response_parts)
 
         # Persist assistant message after stream completes
         if full_response:
@@ -5,6 +5,7 @@ GET  /api/provider/config  — 获取当前 provider 配置和可用列表
 POST /api/provider/config  — 更新 provider 配置（热切换，不需要重启）
 """
 
+import functools
 import logging
 import os
 
@@ -13,34 +14,39 @@ from pydantic import BaseModel
 from typing import Optional
 
 from backend import database
-from src.providers.openai_compatible import PROVIDER_PRESETS
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/provider", tags=["provider"])
 
 
 # 所有可用 Provider 及其模型列表
-AVAILABLE_PROVIDERS = {
-    "tongyi": {
-        "label": "通义千问 (Tongyi)",
-        "models": ["qwen-turbo", "qwen-plus", "qwen-max"],
-        "default_model": "qwen-turbo",
-        "env_key": "DASHSCOPE_API_KEY",
-    },
-    **{
-        name: {
-            "label": {
-                "openai": "OpenAI",
-                "deepseek": "DeepSeek",
-                "zhipu": "智谱 (Zhipu)",
-            }.get(name, name),
-            "models": preset["models"],
-            "default_model": preset["default_model"],
-            "env_key": preset["env_key"],
-        }
-        for name, preset in PROVIDER_PRESETS.items()
-    },
-}
+# 首次请求时再构建：src.providers 会连带导入 openai / dashscope / langsmith，
+# 放在模块顶层会让 import backend.main（以及 pytest 收集）都付这笔开销
+@functools.lru_cache(maxsize=1)
+def _available_providers() -> dict:
+    from src.providers.openai_compatible import PROVIDER_PRESETS
+
+    return {
+        "tongyi": {
+            "label": "通义千问 (Tongyi)",
+            "models": ["qwen-turbo", "qwen-plus", "qwen-max"],
+            "default_model": "qwen-turbo",
+            "env_key": "DASHSCOPE_API_KEY",
+        },
+        **{
+            name: {
+                "label": {
+                    "openai": "OpenAI",
+                    "deepseek": "DeepSeek",
+                    "zhipu": "智谱 (Zhipu)",
+                }.get(name, name),
+                "models": preset["models"],
+                "default_model": preset["default_model"],
+                "env_key": preset["env_key"],
+            }
+            for name, preset in PROVIDER_PRESETS.items()
+        },
+    }
 
 
 class ProviderConfigRequest(BaseModel):
@@ -58,7 +64,7 @@ def get_provider_config():
 
     # 检查每个 provider 是否有 API key（.env 或 settings 表）
     providers_with_status = {}
-    for name, info in AVAILABLE_PROVIDERS.items():
+    for name, info in _available_providers().items():
         env_key = info["env_key"]
         has_key = bool(
             database.get_setting(f"{name}_api_key")
@@ -80,12 +86,13 @@ def get_provider_config():
 def update_provider_config(body: ProviderConfigRequest):
     """更新 provider 配置并热切换"""
     provider = body.provider.lower()
+    available_providers = _available_providers()
 
-    if provider not in AVAILABLE_PROVIDERS:
-        return {"error": f"Unknown provider: {provider}", "available": list(AVAILABLE_PROVIDERS.keys())}
+    if provider not in available_providers:
+        return {"error": f"Unknown provider: {provider}", "available": list(available_providers.keys())}
 
     # 验证模型是否在该 provider 的列表中
-    valid_models = AVAILABLE_PROVIDERS[provider]["models"]
+    valid_models = available_providers[provider]["models"]
     if body.model not in valid_models:
         return {"error": f"Invalid model: {body.model}", "validModels": valid_models}
 
@@ -93,7 +100,7 @@ def update_provider_config(body: ProviderConfigRequest):
     if body.apiKey:
         database.upsert_setting(f"{provider}_api_key", body.apiKey)
         # 同时设置到环境变量，让当前进程立即生效
-        env_key = AVAILABLE_PROVIDERS[provider]["env_key"]
+        env_key = available_providers[provider]["env_key"]
         os.environ[env_key] = body.apiKey
 
     # 保存 provider 和 model 选择
@@ -101,8 +108,14 @@ def update_provider_config(body: ProviderConfigRequest):
     database.upsert_setting("llm_model", body.model)
 
     # 热切换：清除所有 session，下次请求时会用新 provider 创建
-    from backend.session_context import _sessions
+    from backend.session_context import _sessions, get_shared_llm
     _sessions.clear()
+    get_shared_llm.cache_clear()
+    try:
+        from src.rag import get_rag_engine
+        get_rag_engine.cache_clear()
+    except ImportError:
+        pass  # RAG 依赖未安装时没有缓存可清
     logger.info(f"[provider] 切换到 {provider}/{body.model}，已清除所有 session")
 
     return {"ok": True, "provider": provider, "model": body.model}
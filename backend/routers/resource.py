@@ -164,9 +164,9 @@ async def _do_refresh(body, config) -> RefreshResponse:
     )
 
     # 4. Assess quality (使用 LLM 生成信息整理)
-    from src.providers.factory import ProviderFactory
+    from backend.session_context import get_shared_llm
     try:
-        llm = ProviderFactory.create_llm()
+        llm = get_shared_llm()
     except Exception:
         llm = None
     assessor = QualityAssessor(llm_provider=llm)
@@ -231,10 +231,10 @@ async def deep_analysis(body: DeepAnalysisRequest):
     用 LLM 提取：核心观点、关键数据、方法论/步骤、可信度评估。
     不需要重新爬取，纯 LLM 分析。
     """
-    from src.providers.factory import ProviderFactory
+    from backend.session_context import get_shared_llm
 
     try:
-        llm = ProviderFactory.create_llm()
+        llm = get_shared_llm()
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"LLM 初始化失败: {e}")
 
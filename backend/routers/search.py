@@ -123,9 +123,9 @@ async def search_stream(body: SearchRequest, request: Request):
                 return
 
             from src.specialists.search_orchestrator import SearchOrchestrator
-            from src.providers.factory import ProviderFactory
+            from backend.session_context import get_shared_llm
             try:
-                llm = ProviderFactory.create_llm()
+                llm = get_shared_llm()
             except Exception as e:
                 logger.warning(f"LLM provider 创建失败，关键词翻译将不可用: {e}")
                 llm = None
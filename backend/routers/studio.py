@@ -305,15 +305,17 @@ async def save_learner_profile(plan_id: str, body: LearnerProfileRequest):
     )
 
 
+_FALLBACKS = {
+    "learning-plan": "# 学习计划\n\n请先上传学习材料，AI 将根据材料内容生成个性化学习计划。",
+    "study-guide": "# 学习指南\n\n请先上传学习材料，AI 将根据材料内容生成学习指南。",
+    "flashcards": "**Q:** 请先上传学习材料\n**A:** AI 将根据材料内容生成闪卡",
+    "quiz": "# 测验\n\n请先上传学习材料，AI 将根据材料内容生成测验题目。",
+    "progress-report": "# 进度报告\n\n暂无学习数据，开始学习后将自动生成进度报告。",
+    "mind-map": "# 思维导图\n\n请先上传学习材料，AI 将根据材料内容生成思维导图。",
+    "day-summary": "# 今日总结\n\n暂无今日学习数据，完成学习任务后将自动生成总结。",
+}
+
+
 def _fallback_content(content_type: str) -> str:
     """TutorAgent 不可用时的降级内容"""
-    fallbacks = {
-        "learning-plan": "# 学习计划\n\n请先上传学习材料，AI 将根据材料内容生成个性化学习计划。",
-        "study-guide": "# 学习指南\n\n请先上传学习材料，AI 将根据材料内容生成学习指南。",
-        "flashcards": "**Q:** 请先上传学习材料\n**A:** AI 将根据材料内容生成闪卡",
-        "quiz": "# 测验\n\n请先上传学习材料，AI 将根据材料内容生成测验题目。",
-        "progress-report": "# 进度报告\n\n暂无学习数据，开始学习后将自动生成进度报告。",
-        "mind-map": "# 思维导图\n\n请先上传学习材料，AI 将根据材料内容生成思维导图。",
-        "day-summary": "# 今日总结\n\n暂无今日学习数据，完成学习任务后将自动生成总结。",
-    }
-    return fallbacks.get(content_type, "内容生成失败，请稍后重试。")
+    return _FALLBACKS.get(content_type, "内容生成失败，请稍后重试。")
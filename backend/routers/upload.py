@@ -8,12 +8,14 @@
 上传后异步进行 parsing → chunking → ready 状态流转。
 """
 
+import os
 import uuid
 import asyncio
+import hashlib
 import logging
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
 
 from fastapi import APIRouter, UploadFile, File, HTTPException, BackgroundTasks
 from fastapi.responses import FileResponse
@@ -27,6 +29,11 @@ router = APIRouter(tags=["upload"])
 UPLOAD_DIR = Path("data/uploads")
 UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
 
+# PDF 纯文本缓存：按文件内容 sha256 寻址，同一份 PDF 重复上传 / 反复查看时不再重新解析
+PDF_TEXT_CACHE_DIR = Path("data/cache/pdf_text")
+# 缓存文件数上限，超出后按最近使用时间淘汰（同一内容可能被多个材料共用，删除材料时不清理）
+PDF_TEXT_CACHE_MAX_FILES = 200
+
 
 class UrlUploadRequest(BaseModel):
     planId: str
@@ -59,18 +66,23 @@ async def _process_pdf(material_id: str, plan_id: str, file_path: Path, filename
         await asyncio.sleep(0.5)  # 模拟解析延迟
 
         # 尝试用 RAGEngine 真实解析
+        # 解析和向量化都是阻塞调用（CPU + Embedding HTTP），放到线程池执行，
+        # 避免后台任务期间卡住事件循环（其他请求、SSE 流式输出）
         try:
-            from src.rag import RAGEngine
-            rag = RAGEngine(collection_name=f"plan_{plan_id}")
-            content = file_path.read_bytes()
-            text = _extract_pdf_text(content)
+            loop = asyncio.get_running_loop()
+            digest = await loop.run_in_executor(None, _file_sha256, file_path)
+            text = await loop.run_in_executor(None, _extract_pdf_text_cached, file_path, digest)
             if text:
                 database.update_material_status(material_id, "chunking")
                 await asyncio.sleep(0.3)
-                rag.add_document(
-                    content=text,
-                    metadata={"source": filename, "plan_id": plan_id, "material_id": material_id},
-                    doc_id=material_id,
+                metadata = {
+                    "source": filename,
+                    "plan_id": plan_id,
+                    "material_id": material_id,
+                    "content_hash": digest,
+                }
+                await loop.run_in_executor(
+                    None, _ingest_pdf_text, plan_id, text, metadata, filename
                 )
         except Exception as e:
             logger.warning(f"RAG ingest failed for {filename}: {e}")
@@ -81,23 +93,112 @@ async def _process_pdf(material_id: str, plan_id: str, file_path: Path, filename
         database.update_material_status(material_id, "error")
 
 
-def _extract_pdf_text(content: bytes) -> str:
-    """提取 PDF 纯文本（用于 RAG 索引）"""
+def _ingest_pdf_text(plan_id: str, text: str, metadata: dict, filename: str) -> None:
+    """写入 PDF 文本到 plan 的向量库（同步，供线程池调用）"""
+    from src.rag import get_rag_engine
+    rag = get_rag_engine(f"plan_{plan_id}")
+    digest = metadata["content_hash"]
+    # 同一 plan 已导入过相同 PDF 时复用向量，不再重复调用 Embedding；
+    # 复用只是优化，出错时照常重新向量化
+    try:
+        if rag.reuse_embeddings(digest, metadata):
+            logger.info(f"Reused existing embeddings for {filename} ({digest[:12]})")
+            return
+    except Exception as e:
+        logger.warning(f"Embedding reuse failed for {filename}, re-embedding: {e}")
+    rag.add_document(
+        content=text,
+        metadata=metadata,
+        doc_id=metadata["material_id"],
+    )
+
+
+def _extract_pdf_text(source: Union[bytes, Path]) -> str:
+    """提取 PDF 纯文本（用于 RAG 索引）
+
+    source 可以是文件路径或字节。传路径时由解析器直接按需读文件，
+    不必先把整个 PDF 读进内存再交给解析器。
+    """
     try:
         import fitz  # PyMuPDF
-        doc = fitz.open(stream=content, filetype="pdf")
-        return "\n".join(page.get_text() for page in doc)
+        if isinstance(source, Path):
+            doc = fitz.open(source)
+        else:
+            doc = fitz.open(stream=source, filetype="pdf")
+        with doc:
+            return "\n".join(page.get_text() for page in doc)
     except ImportError:
         pass
     try:
         import pdfplumber, io
-        with pdfplumber.open(io.BytesIO(content)) as pdf:
+        with pdfplumber.open(source if isinstance(source, Path) else io.BytesIO(source)) as pdf:
             return "\n".join(p.extract_text() or "" for p in pdf.pages)
     except ImportError:
         pass
     return ""
 
 
+def _file_sha256(file_path: Path) -> str:
+    """文件内容的 sha256（PDF 文本缓存与向量复用的 key）
+
+    流式计算，不把整个文件读成一个 bytes 对象；
+    Python 3.11+ 用 hashlib.file_digest（C 层 readinto 循环），3.10 分块读取。
+    """
+    with open(file_path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        h = hashlib.sha256()
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+        return h.hexdigest()
+
+
+def _extract_pdf_text_cached(file_path: Path, digest: Optional[str] = None) -> str:
+    """提取 PDF 纯文本，命中内容寻址缓存时直接读取缓存文件
+
+    缓存先写到同目录的 .tmp 临时文件再 os.replace 原子替换，
+    并发读到的要么是完整文件、要么不存在，不会拿到写了一半的文本。
+    """
+    cache_file = PDF_TEXT_CACHE_DIR / f"{digest or _file_sha256(file_path)}.txt"
+    try:
+        text = cache_file.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        text = ""  # 未命中，或刚被其他 worker 淘汰，重新解析
+    if text:
+        try:
+            # 刷新 mtime，淘汰时视为最近使用（不用 touch()，文件已被淘汰时不会建出空文件）
+            os.utime(cache_file)
+        except OSError:
+            pass
+        return text
+
+    text = _extract_pdf_text(file_path)
+    if text:
+        tmp_file = cache_file.with_name(f"{cache_file.stem}.{uuid.uuid4().hex}.tmp")
+        try:
+            PDF_TEXT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_file.write_text(text, encoding="utf-8")
+            os.replace(tmp_file, cache_file)
+            _prune_pdf_text_cache()
+        except OSError as e:
+            tmp_file.unlink(missing_ok=True)
+            logger.warning(f"PDF 文本缓存写入失败: {e}")
+    return text
+
+
+def _prune_pdf_text_cache() -> None:
+    """缓存文件超过 PDF_TEXT_CACHE_MAX_FILES 时删除最久未使用的（只统计 .txt，不动写入中的 .tmp）"""
+    entries = []
+    for f in PDF_TEXT_CACHE_DIR.glob("*.txt"):
+        try:
+            entries.append((f.stat().st_mtime, f))
+        except FileNotFoundError:
+            continue  # 已被其他 worker 淘汰
+    entries.sort()
+    for _, stale in entries[:-PDF_TEXT_CACHE_MAX_FILES]:
+        stale.unlink(missing_ok=True)
+
+
 def _extract_pdf_rich_content(content: bytes) -> str:
     """提取 PDF 图文混排内容（文本 + base64 图片），返回 Markdown 格式"""
     import base64
@@ -145,13 +246,15 @@ async def _process_text_file(material_id: str, plan_id: str, file_path: Path, fi
             database.update_material_status(material_id, "chunking")
             await asyncio.sleep(0.2)
             try:
-                from src.rag import RAGEngine
-                rag = RAGEngine(collection_name=f"plan_{plan_id}")
-                rag.add_document(
+                from src.rag import get_rag_engine
+                loop = asyncio.get_running_loop()
+                rag = await loop.run_in_executor(None, get_rag_engine, f"plan_{plan_id}")
+                # Embedding 是阻塞 HTTP 调用，放到线程池，不占用事件循环
+                await loop.run_in_executor(None, lambda: rag.add_document(
                     content=text,
                     metadata={"source": filename, "plan_id": plan_id, "material_id": material_id},
                     doc_id=material_id,
-                )
+                ))
             except Exception as e:
                 logger.warning(f"RAG ingest failed for {filename}: {e}")
 
@@ -358,7 +461,7 @@ async def get_material_content(material_id: str, plan_id: str = ""):
             file_type = "markdown" if mat_type == "markdown" else ("pdf" if mat_type == "pdf" else "text")
             try:
                 if mat_type == "pdf":
-                    content = _extract_pdf_text(f.read_bytes())
+                    content = _extract_pdf_text_cached(f)
                 else:
                     content = f.read_text(encoding="utf-8", errors="replace")
                 return {"id": material_id, "content": content, "fileType": file_type}
@@ -431,11 +534,15 @@ async def add_materials_from_search(body: BatchAddRequest):
                 "extraData": item.extraData or {},
             })
             added.append(item.id)
-
-            # 写入 ChromaDB，使 Studio 全局 RAG 可检索
-            _ingest_search_material_to_chroma(item)
         except (ValueError, RuntimeError) as e:
             logger.warning("Skip duplicate or failed material %s: %s", item.id, e)
+
+    # 写入 ChromaDB，使 Studio 全局 RAG 可检索（同一 plan 的材料合并为一次批量写入）
+    # Embedding 是阻塞的网络请求，放到线程池，不卡住事件循环
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(
+        None, _ingest_search_materials_to_chroma, [item for item in body.items if item.id in added]
+    )
     # Sync source count for each unique plan
     plan_ids = set(item.planId for item in body.items)
     for pid in plan_ids:
@@ -443,11 +550,11 @@ async def add_materials_from_search(body: BatchAddRequest):
     return {"added": added, "count": len(added)}
 
 
-def _ingest_search_material_to_chroma(item: SearchMaterialItem) -> None:
-    """将搜索来源材料的 extra_data 内容写入 ChromaDB。"""
+def _search_material_to_text(item: SearchMaterialItem) -> str:
+    """拼接搜索来源材料 extra_data 中的有效内容。"""
     extra = item.extraData or {}
     if not extra:
-        return
+        return ""
 
     # 拼接有效内容
     parts = []
@@ -464,21 +571,51 @@ def _ingest_search_material_to_chroma(item: SearchMaterialItem) -> None:
     if key_facts:
         parts.append("；".join(key_facts))
 
-    content = "\n\n".join(parts).strip()
-    if not content:
-        return
+    return "\n\n".join(parts).strip()
 
-    try:
-        from src.rag import RAGEngine
-        rag = RAGEngine(collection_name=f"plan_{item.planId}")
-        rag.add_document(
-            content=content,
-            metadata={
-                "material_id": item.id,
-                "source": item.name,
-                "plan_id": item.planId,
-            },
-        )
-        logger.info(f"[upload] ChromaDB ingest OK for search material {item.id}")
-    except Exception as e:
-        logger.warning(f"[upload] ChromaDB ingest failed for {item.id}: {e}")
+
+def _ingest_search_materials_to_chroma(items: list[SearchMaterialItem]) -> None:
+    """将搜索来源材料的 extra_data 内容批量写入 ChromaDB（每个 plan 一次 add_documents）。
+
+    批量写入失败时整批已回滚，逐条重试，只跳过真正失败的那几条。
+    """
+    items_by_plan: dict[str, list[tuple[SearchMaterialItem, str]]] = {}
+    for item in items:
+        content = _search_material_to_text(item)
+        if content:
+            items_by_plan.setdefault(item.planId, []).append((item, content))
+
+    for plan_id, plan_items in items_by_plan.items():
+        material_ids = [item.id for item, _ in plan_items]
+        try:
+            from src.rag.engine import Document, get_rag_engine
+            rag = get_rag_engine(f"plan_{plan_id}")
+        except Exception as e:
+            logger.warning(f"[upload] ChromaDB unavailable for {material_ids}: {e}")
+            continue
+
+        documents = [
+            Document(
+                content=content,
+                metadata={
+                    "material_id": item.id,
+                    "source": item.name,
+                    "plan_id": item.planId,
+                },
+            )
+            for item, content in plan_items
+        ]
+        try:
+            rag.add_documents(documents)
+            logger.info(f"[upload] ChromaDB ingest OK for search materials {material_ids}")
+            continue
+        except Exception as e:
+            logger.warning(f"[upload] ChromaDB batch ingest failed for {material_ids}, retrying one by one: {e}")
+
+        for doc in documents:
+            material_id = doc.metadata["material_id"]
+            try:
+                rag.add_document(content=doc.content, metadata=doc.metadata)
+                logger.info(f"[upload] ChromaDB ingest OK for search material {material_id}")
+            except Exception as e:
+                logger.warning(f"[upload] ChromaDB ingest failed for {material_id}: {e}")
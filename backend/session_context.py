@@ -4,12 +4,14 @@ SessionContext — 懒加载会话上下文
 每个 plan_id 对应一个独立的 SessionContext，按需初始化 TutorAgent 等重型对象。
 """
 
+import functools
 import logging
 from typing import Dict, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from src.agents.tutor import TutorAgent
     from src.core.progress import ProgressTracker
+    from src.providers.base import LLMProvider
 
 logger = logging.getLogger(__name__)
 
@@ -64,6 +66,17 @@ class SessionContext:
         return self._progress
 
 
+@functools.lru_cache(maxsize=1)
+def get_shared_llm() -> "LLMProvider":
+    """获取进程级共享的默认 LLM Provider
+
+    搜索、资源分析等不绑定 plan 的端点复用同一个实例，避免每次请求都重建
+    客户端（连接池、TLS 握手）。创建失败时异常不会被缓存，下次调用会重试。
+    """
+    from src.providers.factory import ProviderFactory
+    return ProviderFactory.create_llm()
+
+
 def get_session(plan_id: str) -> SessionContext:
     """获取或创建 plan_id 对应的 SessionContext"""
     if plan_id not in _sessions:
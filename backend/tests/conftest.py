@@ -3,11 +3,117 @@ Test fixtures for backend tests.
 
 Uses a temporary SQLite database for each test session to avoid
 polluting the real data/app.db.
+
+真实调用外部 API（LLM、联网搜索）的用例标记为 @pytest.mark.integration，
+默认跳过，传 --run-integration 才执行；单元测试用 fake_llm / fake_embedding
+替换 ProviderFactory，返回固定内容，不走网络。
 """
 
+import hashlib
+import math
+import os
+from types import SimpleNamespace
+
 import pytest
 import backend.database as db_mod
 
+# 测试中的 RAGEngine 默认使用内存 Chroma，不写 data/chroma
+os.environ.setdefault("CHROMA_PERSIST_DIR", ":memory:")
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-integration",
+        action="store_true",
+        default=False,
+        help="运行 @pytest.mark.integration 标记的用例（会调用真实外部 API）",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "integration: 调用真实外部 API 的用例，默认跳过")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-integration"):
+        return
+    skip = pytest.mark.skip(reason="需要 --run-integration")
+    for item in items:
+        if "integration" in item.keywords:
+            item.add_marker(skip)
+
+
+class _FakeLLM:
+    """确定性 LLM：所有请求返回同一段固定文本"""
+
+    reply = "Fake answer covering LangChain, RAG and Multi-Head Attention."
+
+    @property
+    def model_name(self) -> str:
+        return "fake-llm"
+
+    def chat(self, messages, temperature=0.7, max_tokens=None, **kwargs):
+        return SimpleNamespace(content=self.reply, model=self.model_name, usage=None)
+
+    def stream(self, messages, temperature=0.7, max_tokens=None, **kwargs):
+        yield self.reply
+
+    def simple_chat(self, prompt, system_prompt=None):
+        return self.reply
+
+
+class _FakeEmbedding:
+    """确定性 Embedding：按文本 sha256 生成单位向量（不依赖进程级随机的 hash()）"""
+
+    embedding_dim = 1536
+
+    def __init__(self):
+        self.embedded = []  # 记录送去向量化的文本，便于断言是否走了 fake
+        self.fail_on = None  # 文本包含该子串时抛错，模拟 Embedding API 失败
+
+    def embed_text(self, text):
+        if self.fail_on and self.fail_on in text:
+            raise RuntimeError(f"fake embedding failure: {self.fail_on}")
+        self.embedded.append(text)
+        digest = hashlib.sha256(text.encode("utf-8")).digest()
+        vec = [digest[i % len(digest)] + 1 for i in range(self.embedding_dim)]
+        norm = math.sqrt(sum(v * v for v in vec))
+        return [v / norm for v in vec]
+
+    def embed_texts(self, texts):
+        return [self.embed_text(t) for t in texts]
+
+    def embed_query(self, query):
+        return self.embed_text(query)
+
+
+@pytest.fixture
+def fake_llm(monkeypatch):
+    """用 _FakeLLM 替换 ProviderFactory.create_llm，并清掉已缓存的 LLM / session"""
+    from src.providers.factory import ProviderFactory
+    from backend.session_context import _sessions, get_shared_llm
+
+    llm = _FakeLLM()
+    monkeypatch.setattr(ProviderFactory, "create_llm", classmethod(lambda cls, *a, **kw: llm))
+    _sessions.clear()
+    get_shared_llm.cache_clear()
+    yield llm
+    _sessions.clear()
+    get_shared_llm.cache_clear()
+
+
+@pytest.fixture
+def fake_embedding(monkeypatch):
+    """用 _FakeEmbedding 替换 ProviderFactory.create_embedding，并清掉已缓存的 RAGEngine"""
+    from src.providers.factory import ProviderFactory
+    from src.rag.engine import get_rag_engine
+
+    embedding = _FakeEmbedding()
+    monkeypatch.setattr(ProviderFactory, "create_embedding", classmethod(lambda cls, *a, **kw: embedding))
+    get_rag_engine.cache_clear()
+    yield embedding
+    get_rag_engine.cache_clear()
+
 
 @pytest.fixture(autouse=True)
 def fresh_db(tmp_path):
@@ -0,0 +1,42 @@
+"""
+database JSON 列序列化单元测试（orjson 与标准库 json 两条路径）
+"""
+
+from datetime import datetime
+
+import pytest
+
+import backend.database as db_mod
+
+_ORJSON = db_mod.orjson
+
+
+@pytest.fixture(params=["orjson", "json"])
+def json_backend(request, monkeypatch):
+    if request.param == "orjson":
+        if _ORJSON is None:
+            pytest.skip("orjson 未安装")
+        monkeypatch.setattr(db_mod, "orjson", _ORJSON)
+    else:
+        monkeypatch.setattr(db_mod, "orjson", None)
+    return request.param
+
+
+def test_json_round_trip(json_backend):
+    data = {"标题": "注意力机制", "tags": ["RAG", "多头注意力"], 1: {"score": 0.5}, "none": None}
+
+    text = db_mod._json_dumps(data)
+
+    assert isinstance(text, str)
+    assert "注意力机制" in text  # 中文不转义
+    assert db_mod._json_loads(text) == {
+        "标题": "注意力机制",
+        "tags": ["RAG", "多头注意力"],
+        "1": {"score": 0.5},
+        "none": None,
+    }
+
+
+def test_json_dumps_rejects_datetime(json_backend):
+    with pytest.raises(TypeError):
+        db_mod._json_dumps({"at": datetime(2024, 1, 1)})
@@ -53,6 +53,7 @@ class TestPlans:
 
 
 
+@pytest.mark.integration
 class TestSearch:
     def test_search_returns_list(self):
         r = client.post("/api/search", json={"query": "Python tutorial"})
@@ -61,7 +62,7 @@ class TestSearch:
 
 
 class TestStudio:
-    def test_valid_type(self):
+    def test_valid_type(self, fake_llm):
         r = client.post("/api/studio/study-guide", json={
             "planId": "test",
             "allDays": [],
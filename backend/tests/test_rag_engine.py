@@ -0,0 +1,78 @@
+"""
+RAGEngine 单元测试（内存 Chroma + fake_embedding，不走网络）
+"""
+
+import uuid
+
+import pytest
+
+from src.rag.engine import RAGEngine
+
+
+def _new_engine(**kwargs) -> RAGEngine:
+    # 内存 Chroma 在进程内共享，每个用例用独立的 collection
+    return RAGEngine(collection_name=f"test_{uuid.uuid4().hex}", persist_directory=":memory:", **kwargs)
+
+
+def test_vectors_come_from_embedding_provider(fake_embedding):
+    rag = _new_engine()
+    rag.add_document("Transformer 用 Multi-Head Attention 建模序列。", metadata={"source": "a.md"})
+    assert "Transformer 用 Multi-Head Attention 建模序列。" in fake_embedding.embedded
+
+
+def test_memory_engine_add_retrieve_clear(fake_embedding):
+    rag = _new_engine()
+    rag.add_document("RAG 先检索再生成。", metadata={"source": "rag.md"})
+    rag.add_document("LangChain 提供 Chain 和 Agent 抽象。", metadata={"source": "lc.md"})
+    assert rag.count() == 2
+
+    results = rag.retrieve("RAG 先检索再生成。", k=1)
+    assert results[0].content == "RAG 先检索再生成。"
+    assert results[0].metadata["source"] == "rag.md"
+
+    rag.clear()
+    assert rag.count() == 0
+
+
+def test_failed_batch_rolls_back_earlier_batches(fake_embedding, monkeypatch):
+    import src.rag.engine as engine_mod
+
+    monkeypatch.setattr(engine_mod, "ADD_BATCH_SIZE", 2)
+    fake_embedding.fail_on = "BOOM"
+    rag = _new_engine()
+    docs = [
+        engine_mod.Document(content="第一段", metadata={"source": "a"}),
+        engine_mod.Document(content="第二段", metadata={"source": "b"}),
+        engine_mod.Document(content="第三段 BOOM", metadata={"source": "c"}),
+    ]
+
+    with pytest.raises(RuntimeError, match="向量化失败"):
+        rag.add_documents(docs)
+    assert rag.count() == 0
+
+
+def test_reuse_embeddings_copies_complete_set(fake_embedding):
+    rag = _new_engine(chunk_size=20, chunk_overlap=0)
+    paragraphs = [c * 15 for c in "甲乙丙"]
+    first = rag.add_document("\n\n".join(paragraphs), metadata={"content_hash": "h1", "material_id": "m1"})
+    assert len(first) == 3
+
+    embedded_before = len(fake_embedding.embedded)
+    reused = rag.reuse_embeddings("h1", metadata={"material_id": "m2"})
+
+    assert len(reused) == 3
+    assert len(fake_embedding.embedded) == embedded_before  # 没有再调 Embedding
+    copied = rag._vectorstore._collection.get(where={"material_id": "m2"})
+    assert sorted(copied["documents"]) == sorted(paragraphs)
+
+
+def test_reuse_embeddings_skips_partial_set(fake_embedding):
+    rag = _new_engine()
+    # 上次导入只写进了 3 块中的 2 块
+    rag._vectorstore.add_texts(
+        texts=["甲", "乙"],
+        metadatas=[{"content_hash": "h2", "chunk_index": i, "total_chunks": 3} for i in range(2)],
+    )
+
+    assert rag.reuse_embeddings("h2", metadata={"material_id": "m3"}) == []
+    assert rag.count() == 2
@@ -0,0 +1,107 @@
+"""
+upload 路由辅助函数单元测试（不走网络）
+"""
+
+import os
+import uuid
+
+import backend.routers.upload as upload
+from backend.routers.upload import SearchMaterialItem, _ingest_search_materials_to_chroma
+from src.rag.engine import RAGEngine, get_rag_engine
+
+
+def test_search_ingest_skips_only_failing_item(fake_embedding):
+    plan_id = uuid.uuid4().hex
+    items = [
+        SearchMaterialItem(
+            id=material_id,
+            planId=plan_id,
+            platform="bilibili",
+            name=material_id,
+            url=f"https://example.com/{material_id}",
+            extraData={"contentSummary": summary},
+        )
+        for material_id, summary in [("m1", "注意力机制入门"), ("m2", "BOOM 坏数据"), ("m3", "RAG 实战")]
+    ]
+    fake_embedding.fail_on = "BOOM"
+
+    _ingest_search_materials_to_chroma(items)
+
+    stored = get_rag_engine(f"plan_{plan_id}")._vectorstore._collection.get(include=["metadatas"])
+    assert sorted(m["material_id"] for m in stored["metadatas"]) == ["m1", "m3"]
+
+
+def test_pdf_ingest_falls_back_when_reuse_fails(fake_embedding, monkeypatch):
+    def broken_reuse(self, content_hash, metadata=None):
+        raise RuntimeError("chroma get failed")
+
+    monkeypatch.setattr(RAGEngine, "reuse_embeddings", broken_reuse)
+    plan_id = uuid.uuid4().hex
+    metadata = {"source": "a.pdf", "plan_id": plan_id, "material_id": "m1", "content_hash": "h1"}
+
+    upload._ingest_pdf_text(plan_id, "Self-Attention 计算 Q、K、V。", metadata, "a.pdf")
+
+    assert get_rag_engine(f"plan_{plan_id}").count() == 1
+
+
+def _count_extractions(monkeypatch, text="PDF 正文"):
+    calls = []
+
+    def fake_extract(source):
+        calls.append(source)
+        return text
+
+    monkeypatch.setattr(upload, "_extract_pdf_text", fake_extract)
+    return calls
+
+
+def test_pdf_text_cache_miss_then_hit(tmp_path, monkeypatch):
+    monkeypatch.setattr(upload, "PDF_TEXT_CACHE_DIR", tmp_path / "cache")
+    calls = _count_extractions(monkeypatch)
+    pdf = tmp_path / "a.pdf"
+    pdf.write_bytes(b"%PDF-1.4 fake")
+
+    assert upload._extract_pdf_text_cached(pdf) == "PDF 正文"  # 未命中：解析并写缓存
+    assert len(calls) == 1
+    assert (tmp_path / "cache" / f"{upload._file_sha256(pdf)}.txt").exists()
+
+    assert upload._extract_pdf_text_cached(pdf) == "PDF 正文"  # 命中：不再解析
+    assert len(calls) == 1
+
+
+def test_pdf_text_cache_evicts_least_recently_used(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    monkeypatch.setattr(upload, "PDF_TEXT_CACHE_DIR", cache_dir)
+    monkeypatch.setattr(upload, "PDF_TEXT_CACHE_MAX_FILES", 2)
+    _count_extractions(monkeypatch)
+    for i, name in enumerate(["old", "recent"]):
+        entry = cache_dir / f"{name}.txt"
+        entry.write_text(name, encoding="utf-8")
+        os.utime(entry, (1000 + i, 1000 + i))
+    pdf = tmp_path / "b.pdf"
+    pdf.write_bytes(b"%PDF-1.4 another")
+
+    upload._extract_pdf_text_cached(pdf)
+
+    remaining = sorted(f.stem for f in cache_dir.glob("*.txt"))
+    assert remaining == sorted(["recent", upload._file_sha256(pdf)])
+
+
+def test_pdf_text_cache_ignores_leftover_tmp(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    monkeypatch.setattr(upload, "PDF_TEXT_CACHE_DIR", cache_dir)
+    monkeypatch.setattr(upload, "PDF_TEXT_CACHE_MAX_FILES", 1)
+    calls = _count_extractions(monkeypatch)
+    pdf = tmp_path / "c.pdf"
+    pdf.write_bytes(b"%PDF-1.4 crashed")
+    digest = upload._file_sha256(pdf)
+    # 上次写缓存时进程崩溃，只留下写了一半的临时文件
+    leftover = cache_dir / f"{digest}.dead.tmp"
+    leftover.write_text("PDF", encoding="utf-8")
+
+    assert upload._extract_pdf_text_cached(pdf) == "PDF 正文"
+    assert len(calls) == 1
+    assert leftover.exists()
+    assert [f.name for f in cache_dir.glob("*.txt")] == [f"{digest}.txt"]
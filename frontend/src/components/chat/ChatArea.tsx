@@ -119,7 +119,7 @@ export const ChatArea: React.FC<ChatAreaProps> = ({ planId = '' }) => {
                 <div className="text-[#202124] w-fit max-w-[90%] pb-2">
                   <div className="prose max-w-none text-[#1A1A18] leading-[1.6] prose-p:my-1.5 prose-headings:mt-4 prose-headings:mb-2 prose-headings:font-bold prose-headings:text-black prose-strong:font-extrabold prose-strong:text-black prose-strong:tracking-tight prose-hr:my-3 prose-ul:my-1.5 prose-ol:my-1.5 prose-li:my-0.5 prose-code:bg-gray-100 prose-code:text-[#D97757] prose-code:px-1.5 prose-code:py-0.5 prose-code:rounded-md prose-code:before:content-none prose-code:after:content-none prose-pre:bg-[#1E1E1E] prose-pre:text-gray-100 prose-pre:rounded-xl text-[16px] tracking-normal [&_pre_code]:bg-transparent [&_pre_code]:text-gray-100 [&_pre_code]:p-0">
                     <ReactMarkdown>{streamingContent}</ReactMarkdown>
-                    <span className="inline-block w-0.5 h-[1em] bg-[#D97757] animate-pulse ml-1 align-middle" />
+                    <span className="inline-block w-0.5 h-[1em] bg-[#D97757] animate-pulse will-change-[opacity] ml-1 align-middle" />
                   </div>
                 </div>
               </div>
@@ -5,11 +5,17 @@ import { MaterialIcon } from './MaterialItem'
 import { SearchPanel } from './SearchPanel'
 import { UploadArea } from './UploadArea'
 import { PreviewPopup } from './PreviewPopup'
-import { ContentViewer } from './ContentViewer'
+import { Spinner } from '../ui/Spinner'
 import { useSourceStore } from '../../store/sourceStore'
 import { useSearchStore } from '../../store/searchStore'
 import type { Material, SearchResult } from '../../types'
 
+// 材料查看器（含 react-pdf 及其 AnnotationLayer/TextLayer 样式）按需加载，
+// 仅在用户打开材料时才拉取，不进入工作区首屏包
+const ContentViewer = React.lazy(() =>
+  import('./ContentViewer').then(m => ({ default: m.ContentViewer }))
+)
+
 type ActiveTab = 'upload' | 'search'
 
 function isLocalFile(m: Material): boolean {
@@ -192,13 +198,15 @@ export const SourcePanel: React.FC<SourcePanelProps> = ({
 
       {viewingMaterial && (
         <div className="absolute inset-0 z-50 bg-white dark:bg-dark-surface overflow-hidden">
-          <ContentViewer
-            materialId={viewingMaterial.id}
-            materialName={viewingMaterial.name}
-            fileType={inferFileType(viewingMaterial.name)}
-            planId={planId}
-            onBack={() => { setViewingMaterial(null); setSelectedId(null); onReadingChange?.(false) }}
-          />
+          <React.Suspense fallback={<div className="flex h-full items-center justify-center"><Spinner size="lg" /></div>}>
+            <ContentViewer
+              materialId={viewingMaterial.id}
+              materialName={viewingMaterial.name}
+              fileType={inferFileType(viewingMaterial.name)}
+              planId={planId}
+              onBack={() => { setViewingMaterial(null); setSelectedId(null); onReadingChange?.(false) }}
+            />
+          </React.Suspense>
         </div>
       )}
 
@@ -228,7 +228,7 @@ export const ContentViewer: React.FC<ContentViewerProps> = ({ content, onClose }
   }
 
   return (
-    <div className="fixed inset-0 z-50 flex items-center justify-center bg-black/40 backdrop-blur-sm" onClick={onClose}>
+    <div className="fixed inset-0 z-50 flex items-center justify-center modal-backdrop" onClick={onClose}>
       <div className="bg-white dark:bg-dark-surface rounded-2xl shadow-2xl w-[90vw] max-w-[900px] max-h-[90vh] flex flex-col overflow-hidden"
         onClick={e => e.stopPropagation()}>
         {/* 标题栏 */}
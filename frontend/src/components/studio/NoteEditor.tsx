@@ -57,7 +57,7 @@ export const NoteEditor: React.FC<NoteEditorProps> = ({ note, planId, onSave, on
   }
 
   return (
-    <div className="fixed inset-0 z-50 flex items-center justify-center bg-black/40 backdrop-blur-sm">
+    <div className="fixed inset-0 z-50 flex items-center justify-center modal-backdrop">
       <div className="bg-white dark:bg-dark-surface rounded-2xl shadow-2xl w-[680px] min-h-[500px] max-h-[80vh] flex flex-col overflow-hidden">
         {/* 标题栏 */}
         <div className="flex items-center justify-between px-5 py-3.5 border-b border-[#DADCE0] dark:border-dark-border">
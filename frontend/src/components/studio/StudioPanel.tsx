@@ -294,7 +294,7 @@ export const StudioPanel: React.FC<StudioPanelProps> = ({ planId = '', isCollaps
                     </div>
                     <span className="text-[13px] font-medium text-[#202124]">{t.label}</span>
                     {loadingTools.has(t.type) && (
-                      <div className="absolute inset-0 bg-white/50 rounded-2xl flex items-center justify-center backdrop-blur-[1px]">
+                      <div className="absolute inset-0 bg-white/70 rounded-2xl flex items-center justify-center">
                         <div className="w-5 h-5 border-2 border-[#D97757] border-t-transparent rounded-full animate-spin" />
                       </div>
                     )}
@@ -33,7 +33,7 @@ export const Modal: React.FC<ModalProps> = ({
     >
       {/* 遮罩 */}
       <div
-        className="absolute inset-0 bg-black/40 backdrop-blur-sm"
+        className="absolute inset-0 modal-backdrop"
         onClick={onClose}
         aria-hidden="true"
       />
@@ -3,12 +3,28 @@ Agents 模块 - 功能 Agent 层
 
 包含 Planner、Tutor 两个核心 Agent
 以及 Orchestrator 协调器
+
+导出按需加载：后端只用到 TutorAgent 等个别子模块，
+import src.agents.tutor 时不应连带加载 Orchestrator / Planner 的整条依赖链。
 """
 
-from .base import BaseAgent
-from .planner import PlannerAgent
-from .tutor import TutorAgent
-from .orchestrator import Orchestrator, OrchestratorMode, OrchestratorState
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .base import BaseAgent
+    from .planner import PlannerAgent
+    from .tutor import TutorAgent
+    from .orchestrator import Orchestrator, OrchestratorMode, OrchestratorState
+
+_EXPORTS = {
+    "BaseAgent": ".base",
+    "PlannerAgent": ".planner",
+    "TutorAgent": ".tutor",
+    "Orchestrator": ".orchestrator",
+    "OrchestratorMode": ".orchestrator",
+    "OrchestratorState": ".orchestrator",
+}
 
 __all__ = [
     "BaseAgent",
@@ -19,3 +35,8 @@ __all__ = [
     "OrchestratorState",
 ]
 
+
+def __getattr__(name: str):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -30,6 +30,23 @@ from src.rag import RAGEngine
 from src.core.search_keywords import is_search_intent
 from src.specialists.resource_searcher import ResourceSearcher
 
+# 每条消息都会走意图识别，正则在模块加载时编译一次
+_GITHUB_URL_PREFIX_RE = re.compile(r'https?://github\.com/')
+_GITHUB_REPO_URL_RE = re.compile(r'https?://github\.com/[\w\-]+/[\w\-]+')
+_GITHUB_PROJECT_NAME_RE = re.compile(r'github\.com/[\w-]+/([\w-]+)')
+_CODE_FENCE_RE = re.compile(r"^```(?:json)?\s*|\s*```$", re.IGNORECASE)
+_JSON_OBJECT_RE = re.compile(r"\{[\s\S]*\}")
+
+# 意图关键词：每个意图预编译成一个正则 alternation，一次扫描代替逐个 `in` 判断
+_CREATE_PLAN_KEYWORDS = [
+    "生成计划", "学习计划", "plan for", "roadmap", "学习规划", "生成大纲",
+    "做一个规划", "做个规划", "帮我规划", "规划一下", "给我规划",
+    "做一个计划", "做个计划", "给我做一个", "给我做个",
+]
+_REPORT_KEYWORDS = ["报告", "进度", "report", "progress", "总结"]
+_CREATE_PLAN_RE = re.compile("|".join(map(re.escape, _CREATE_PLAN_KEYWORDS)))
+_REPORT_RE = re.compile("|".join(map(re.escape, _REPORT_KEYWORDS)))
+
 
 class OrchestratorMode(str, Enum):
     """协调器模式"""
@@ -546,14 +563,10 @@ class Orchestrator:
         input_lower = user_input.lower()
 
         # 优先级 1: create_plan
-        if any(kw in input_lower for kw in [
-            "生成计划", "学习计划", "plan for", "roadmap", "学习规划", "生成大纲",
-            "做一个规划", "做个规划", "帮我规划", "规划一下", "给我规划",
-            "做一个计划", "做个计划", "给我做一个", "给我做个",
-        ]):
+        if _CREATE_PLAN_RE.search(input_lower):
             return "create_plan"
         # GitHub URL 视为"生成计划"意图（用户粘贴仓库链接，期望分析并生成计划）
-        if re.match(r'https?://github\.com/', input_lower):
+        if _GITHUB_URL_PREFIX_RE.match(input_lower):
             return "create_plan"
 
         # "分析" + 文档/pdf 相关词 → 视为问答（让 tutor 基于 RAG 分析内容）
@@ -567,7 +580,7 @@ class Orchestrator:
         if is_search_intent(input_lower):
             return "search_resource"
 
-        if any(kw in input_lower for kw in ["报告", "进度", "report", "progress", "总结"]):
+        if _REPORT_RE.search(input_lower):
             return "get_report"
 
         return None
@@ -589,9 +602,9 @@ class Orchestrator:
             ))
             cleaned = raw.strip()
             if cleaned.startswith("```"):
-                cleaned = re.sub(r"^```(?:json)?\s*|\s*```$", "", cleaned, flags=re.IGNORECASE).strip()
+                cleaned = _CODE_FENCE_RE.sub("", cleaned).strip()
 
-            match = re.search(r"\{[\s\S]*\}", cleaned)
+            match = _JSON_OBJECT_RE.search(cleaned)
             if match:
                 cleaned = match.group(0)
 
@@ -600,7 +613,7 @@ class Orchestrator:
             if intent in {"create_plan", "ask_question", "search_resource", "get_report", "chitchat"}:
                 lowered = user_input.lower()
                 # 保护策略：报告必须显式触发
-                if intent == "get_report" and not any(kw in lowered for kw in ["报告", "进度", "report", "progress", "总结"]):
+                if intent == "get_report" and not _REPORT_RE.search(lowered):
                     return "ask_question"
                 return intent
         except Exception:
@@ -633,7 +646,7 @@ class Orchestrator:
         # 提取 GitHub URL
         urls = []
         for msg in user_msgs:
-            url_match = re.search(r'https?://github\.com/[\w\-]+/[\w\-]+', msg)
+            url_match = _GITHUB_REPO_URL_RE.search(msg)
             if url_match:
                 urls.append(url_match.group(0))
         
@@ -671,7 +684,7 @@ class Orchestrator:
         input_stripped = user_input.strip()
         
         # GitHub URL 也需要先问清楚学习目标
-        is_github_url = bool(re.match(r'https?://github\.com/', input_stripped))
+        is_github_url = bool(_GITHUB_URL_PREFIX_RE.match(input_stripped))
         is_vague_text = (
             len(input_stripped) <= 30
             and any(kw in input_stripped for kw in vague_patterns)
@@ -685,7 +698,7 @@ class Orchestrator:
             
             has_doc = bool(self.rag_engine)
             if is_github_url:
-                proj_match = re.search(r'github\.com/[\w-]+/([\w-]+)', input_stripped)
+                proj_match = _GITHUB_PROJECT_NAME_RE.search(input_stripped)
                 proj_name = proj_match.group(1) if proj_match else "该项目"
                 clarify_prompt = (
                     f"用户说：「{user_input}」\n\n"
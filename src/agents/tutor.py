@@ -18,6 +18,7 @@ from typing import Optional, List, Dict, Any, Generator
 from langsmith import traceable
 
 from .base import BaseAgent
+from src.core.config import WEEKDAYS
 from src.core.models import SessionMode, Quiz, Question, SearchResult
 from src.rag import RAGEngine
 from src.providers.base import Message
@@ -74,8 +75,7 @@ class TutorAgent(BaseAgent):
     def system_prompt(self) -> str:
         from datetime import datetime
         now = datetime.now()
-        weekdays = ["星期一", "星期二", "星期三", "星期四", "星期五", "星期六", "星期日"]
-        time_str = f"{now.strftime('%Y年%m月%d日 %H:%M:%S')} {weekdays[now.weekday()]}"
+        time_str = f"{now.strftime('%Y年%m月%d日 %H:%M:%S')} {WEEKDAYS[now.weekday()]}"
         return f"【系统提示：当前真实时间是 {time_str}】\n\n" + self._base_system_prompt
     
     def __init__(self, *args, **kwargs):
@@ -21,8 +21,23 @@ from pydantic import BaseModel
 from dotenv import load_dotenv
 
 
+_ENV_LOADED = False
+
+
+def load_env_once() -> None:
+    """加载 .env 文件（进程内只解析一次，后续调用直接返回）"""
+    global _ENV_LOADED
+    if _ENV_LOADED:
+        return
+    load_dotenv()
+    _ENV_LOADED = True
+
+
 # 加载 .env 文件
-load_dotenv()
+load_env_once()
+
+# 系统提示里的星期文案（TutorAgent 与后端 PromptBuilder 共用，保持两边一致）
+WEEKDAYS = ("星期一", "星期二", "星期三", "星期四", "星期五", "星期六", "星期日")
 
 
 class ProviderConfig(BaseModel):
@@ -73,7 +88,8 @@ class Config:
         
         # 确保目录存在
         self.data_dir.mkdir(parents=True, exist_ok=True)
-        self.chroma_dir.mkdir(parents=True, exist_ok=True)
+        if str(self.chroma_dir) != ":memory:":  # 内存模式（测试）不建目录
+            self.chroma_dir.mkdir(parents=True, exist_ok=True)
         self.user_data_dir.mkdir(parents=True, exist_ok=True)
         
         # Provider 配置
@@ -4,6 +4,8 @@
 避免两处关键词列表不一致导致搜索漏触发或误触发。
 """
 
+import re
+
 SEARCH_KEYWORDS: list[str] = [
     # 显式搜索请求
     "搜索资源", "找资源", "推荐资源", "search resource",
@@ -17,11 +19,13 @@ SEARCH_KEYWORDS: list[str] = [
     "推荐教程", "推荐视频", "推荐文章",
 ]
 
+# 每轮对话都会检测，关键词合并为一个预编译 alternation
+_SEARCH_RE = re.compile("|".join(map(re.escape, SEARCH_KEYWORDS)))
+
 
 def is_search_intent(user_input: str) -> bool:
     """检测用户输入是否包含搜索意图关键词。
 
     对用户输入做 case-insensitive 匹配，只要包含任一关键词即返回 True。
     """
-    input_lower = user_input.lower()
-    return any(kw in input_lower for kw in SEARCH_KEYWORDS)
+    return _SEARCH_RE.search(user_input.lower()) is not None
@@ -13,6 +13,7 @@ OpenAI 兼容 Provider
 >  就覆盖了所有兼容服务商，比每个厂商写一个 Provider 优雅得多。"
 """
 
+import functools
 import os
 from typing import List, Generator, Optional
 
@@ -45,6 +46,18 @@ PROVIDER_PRESETS = {
 }
 
 
+@functools.lru_cache(maxsize=8)
+def _shared_client(api_key: str, base_url: str) -> OpenAI:
+    """
+    按 (api_key, base_url) 复用 OpenAI 客户端
+
+    每个 plan 的 session 都会新建 Provider，如果各自 new OpenAI()，
+    每个实例都有独立的 httpx 连接池，首个请求都要重新 DNS + TLS 握手。
+    共享客户端后 keep-alive 连接在所有 session 间复用（OpenAI 客户端线程安全）。
+    """
+    return wrap_openai(OpenAI(api_key=api_key, base_url=base_url))
+
+
 class OpenAICompatibleProvider(LLMProvider):
     """兼容 OpenAI API 格式的通用 LLM Provider"""
 
@@ -72,10 +85,7 @@ class OpenAICompatibleProvider(LLMProvider):
                 f"Please set it in .env or pass api_key parameter."
             )
 
-        self._client = wrap_openai(OpenAI(
-            api_key=self._api_key,
-            base_url=self._base_url,
-        ))
+        self._client = _shared_client(self._api_key, self._base_url)
 
     @property
     def model_name(self) -> str:
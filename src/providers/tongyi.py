@@ -168,6 +168,9 @@ class TongyiEmbeddingProvider(EmbeddingProvider):
                 "Please set it in .env file or pass it as api_key parameter."
             )
         
+        # 显式设置 dashscope 全局 key，防止 SDK 读取不到
+        dashscope.api_key = self._api_key
+        
         # 初始化 LangChain DashScopeEmbeddings
         self._embeddings = DashScopeEmbeddings(
             model=model,
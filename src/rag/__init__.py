@@ -4,6 +4,6 @@ RAG 模块 - 知识检索增强
 基于 ChromaDB 的向量存储和检索
 """
 
-from .engine import RAGEngine
+from .engine import RAGEngine, get_rag_engine
 
-__all__ = ["RAGEngine"]
+__all__ = ["RAGEngine", "get_rag_engine"]
@@ -18,17 +18,29 @@ RAG Engine - 检索增强生成引擎
 >  基于这些内容回答，既利用了 LLM 的推理能力，又保证了准确性。"
 """
 
+import functools
+import logging
 import os
-from typing import List, Dict, Any, Optional
+import uuid
+from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
 
-import dashscope
 from pydantic import BaseModel
+from langchain_core.embeddings import Embeddings
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 from langchain_chroma import Chroma
 
 from src.providers import ProviderFactory, EmbeddingProvider
 
+logger = logging.getLogger(__name__)
+
+# persist_directory 取此值时使用纯内存 Chroma（测试用，不落盘）
+EPHEMERAL_PERSIST_DIR = ":memory:"
+
+# 单次写入向量库的 chunk 上限：大 PDF 分批 embed + 落库，
+# 避免一次性持有全部向量，也不会超过 Chroma 的单批上限
+ADD_BATCH_SIZE = 64
+
 
 class Document(BaseModel):
     """文档模型"""
@@ -43,6 +55,19 @@ class RetrievalResult(BaseModel):
     score: float  # 相似度分数
 
 
+class _ProviderLangChainEmbedding(Embeddings):
+    """把 EmbeddingProvider 包装成 LangChain Embeddings，可直接传给 Chroma"""
+
+    def __init__(self, provider: EmbeddingProvider):
+        self._provider = provider
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self._provider.embed_texts(texts)
+
+    def embed_query(self, text: str) -> List[float]:
+        return self._provider.embed_query(text)
+
+
 class RAGEngine:
     """
     RAG 引擎
@@ -63,7 +88,8 @@ class RAGEngine:
         
         Args:
             collection_name: ChromaDB collection 名称
-            persist_directory: 持久化目录，默认从环境变量读取
+            persist_directory: 持久化目录，默认从环境变量读取；
+                ":memory:" 表示纯内存，不写磁盘
             embedding_provider: Embedding Provider，默认使用工厂创建
             chunk_size: 切分块大小
             chunk_overlap: 切分重叠大小
@@ -74,8 +100,11 @@ class RAGEngine:
             "./data/chroma"
         )
         
+        self._ephemeral = self.persist_directory == EPHEMERAL_PERSIST_DIR
+        
         # 确保目录存在
-        Path(self.persist_directory).mkdir(parents=True, exist_ok=True)
+        if not self._ephemeral:
+            Path(self.persist_directory).mkdir(parents=True, exist_ok=True)
         
         # 初始化 Embedding Provider
         self._embedding_provider = embedding_provider or ProviderFactory.create_embedding()
@@ -89,31 +118,24 @@ class RAGEngine:
         )
         
         # 初始化 ChromaDB（使用 LangChain 包装）
-        self._vectorstore = Chroma(
-            collection_name=collection_name,
+        self._vectorstore = self._create_vectorstore()
+    
+    def _create_vectorstore(self) -> Chroma:
+        """创建 Chroma 向量库；persist_directory=None 时 Chroma 使用内存客户端"""
+        return Chroma(
+            collection_name=self.collection_name,
             embedding_function=self._create_langchain_embedding(),
-            persist_directory=self.persist_directory,
+            persist_directory=None if self._ephemeral else self.persist_directory,
         )
     
-    def _create_langchain_embedding(self):
+    def _create_langchain_embedding(self) -> _ProviderLangChainEmbedding:
         """
         创建 LangChain 兼容的 Embedding 函数
         
-        使用 DashScope text-embedding-v2（阿里云通义千问）。
-        如果 API 不可用，回退到本地 sentence-transformers（需能访问 HuggingFace）。
+        包装 self._embedding_provider（默认 DashScope text-embedding-v2），
+        向量库和构造参数用的是同一个 Provider，测试注入 fake 也能生效。
         """
-        from langchain_community.embeddings import DashScopeEmbeddings
-        
-        api_key = os.getenv("DASHSCOPE_API_KEY")
-        
-        # 显式设置全局 API key，确保 SDK 能读取到
-        if api_key:
-            dashscope.api_key = api_key
-        
-        return DashScopeEmbeddings(
-            model="text-embedding-v2",
-            dashscope_api_key=api_key,
-        )
+        return _ProviderLangChainEmbedding(self._embedding_provider)
     
     def add_document(
         self,
@@ -132,6 +154,42 @@ class RAGEngine:
         Returns:
             切分后的 chunk IDs
         """
+        chunks, metadatas = self._split_with_metadata(content, metadata)
+        return self._add_texts(chunks, metadatas)
+    
+    def add_documents(
+        self,
+        documents: List[Document],
+    ) -> List[str]:
+        """
+        批量添加文档
+        
+        先把所有文档切分好，再一次性写入向量库，
+        这样 Embedding 请求按批发送，而不是每篇文档一轮 HTTP 往返。
+        
+        Args:
+            documents: 文档列表
+            
+        Returns:
+            所有 chunk IDs
+        """
+        all_chunks: List[str] = []
+        all_metadatas: List[Dict[str, Any]] = []
+        for doc in documents:
+            chunks, metadatas = self._split_with_metadata(doc.content, doc.metadata)
+            all_chunks.extend(chunks)
+            all_metadatas.extend(metadatas)
+        
+        if not all_chunks:
+            return []
+        return self._add_texts(all_chunks, all_metadatas)
+    
+    def _split_with_metadata(
+        self,
+        content: str,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[List[str], List[Dict[str, Any]]]:
+        """切分文档，并为每个 chunk 生成元数据"""
         metadata = metadata or {}
         
         # 切分文档
@@ -147,13 +205,33 @@ class RAGEngine:
             }
             metadatas.append(chunk_meta)
         
-        # 添加到向量库（embedding 可能因 API 欠费等原因失败）
+        return chunks, metadatas
+    
+    def _add_texts(
+        self,
+        chunks: List[str],
+        metadatas: List[Dict[str, Any]],
+    ) -> List[str]:
+        """
+        写入向量库（按 ADD_BATCH_SIZE 分批；embedding 可能因 API 欠费等原因失败）
+        
+        中途某一批失败时，删掉前面已写入的批次再抛错，
+        保证一篇文档要么全部入库、要么一条不留。
+        """
+        ids: List[str] = []
         try:
-            ids = self._vectorstore.add_texts(
-                texts=chunks,
-                metadatas=metadatas,
-            )
+            for start in range(0, len(chunks), ADD_BATCH_SIZE):
+                end = start + ADD_BATCH_SIZE
+                ids.extend(self._vectorstore.add_texts(
+                    texts=chunks[start:end],
+                    metadatas=metadatas[start:end],
+                ))
         except Exception as e:
+            if ids:
+                try:
+                    self._vectorstore.delete(ids=ids)
+                except Exception as cleanup_err:
+                    logger.warning(f"回滚已写入的 {len(ids)} 个 chunk 失败: {cleanup_err}")
             err_msg = str(e)
             if "Arrearage" in err_msg or "overdue" in err_msg.lower():
                 raise RuntimeError(
@@ -164,24 +242,72 @@ class RAGEngine:
         
         return ids
     
-    def add_documents(
+    def _raw_collection(self):
+        """
+        底层 chromadb Collection
+        
+        LangChain 的 Chroma 包装没有公开按 metadata 取向量 / 直接写入向量的接口，
+        这里依赖 langchain-chroma 的私有属性 _collection；升级版本时只需改这一处。
+        """
+        return self._vectorstore._collection
+    
+    def reuse_embeddings(
         self,
-        documents: List[Document],
+        content_hash: str,
+        metadata: Optional[Dict[str, Any]] = None,
     ) -> List[str]:
         """
-        批量添加文档
+        复用已入库的相同内容的向量
+        
+        同一份文件重复上传时，collection 里已有 content_hash 相同的 chunk，
+        直接拷贝其文本和向量、换上新的元数据写入，跳过 Embedding API 调用。
         
         Args:
-            documents: 文档列表
+            content_hash: 文件内容哈希（写入时放在 metadata["content_hash"]）
+            metadata: 新 chunk 的元数据（来源、material_id 等）
             
         Returns:
-            所有 chunk IDs
+            新写入的 chunk IDs；collection 中没有该内容、或已有 chunk
+            不完整（缺块、total_chunks 对不上）时返回空列表，由调用方重新向量化
         """
-        all_ids = []
-        for doc in documents:
-            ids = self.add_document(doc.content, doc.metadata)
-            all_ids.extend(ids)
-        return all_ids
+        existing = self._raw_collection().get(
+            where={"content_hash": content_hash},
+            include=["embeddings", "documents", "metadatas"],
+        )
+        if not existing["ids"]:
+            return []
+        
+        # 同一内容可能已被导入多次，按 chunk_index 去重，只取一份
+        by_index: Dict[int, Tuple[Any, str]] = {}
+        totals = set()
+        for embedding, doc, meta in zip(
+            existing["embeddings"], existing["documents"], existing["metadatas"]
+        ):
+            meta = meta or {}
+            by_index.setdefault(meta.get("chunk_index", 0), (embedding, doc))
+            totals.add(meta.get("total_chunks"))
+        
+        # 只复用完整的一份：chunk_index 必须是 0..N-1 且与记录的 total_chunks 一致
+        indexes = sorted(by_index)
+        if totals != {len(indexes)} or indexes != list(range(len(indexes))):
+            return []
+        
+        ids = [str(uuid.uuid4()) for _ in indexes]
+        self._raw_collection().add(
+            ids=ids,
+            embeddings=[by_index[i][0] for i in indexes],
+            documents=[by_index[i][1] for i in indexes],
+            metadatas=[
+                {
+                    **(metadata or {}),
+                    "content_hash": content_hash,
+                    "chunk_index": i,
+                    "total_chunks": len(indexes),
+                }
+                for i in indexes
+            ],
+        )
+        return ids
     
     def retrieve(
         self,
@@ -253,7 +379,7 @@ class RAGEngine:
     
     def count(self) -> int:
         """返回文档数量"""
-        return self._vectorstore._collection.count()
+        return self._raw_collection().count()
     
     def query_with_context(
         self,
@@ -348,9 +474,17 @@ class RAGEngine:
         """清空知识库"""
         self.delete_collection()
         # 重新创建
-        self._vectorstore = Chroma(
-            collection_name=self.collection_name,
-            embedding_function=self._create_langchain_embedding(),
-            persist_directory=self.persist_directory,
-        )
+        self._vectorstore = self._create_vectorstore()
 
+
+@functools.lru_cache(maxsize=32)
+def get_rag_engine(collection_name: str = "knowledge_base") -> RAGEngine:
+    """
+    按 collection 复用 RAGEngine 实例
+
+    每次 new RAGEngine 都要重新打开 Chroma 持久化目录（SQLite）、
+    重建 DashScope Embedding 客户端。后端每个请求都按 plan 取一次引擎，
+    缓存后同一 collection 只初始化一次。切换 Provider / API Key 时
+    调用 get_rag_engine.cache_clear() 失效。
+    """
+    return RAGEngine(collection_name=collection_name)
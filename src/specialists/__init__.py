@@ -2,14 +2,32 @@
 Specialists 模块 - 专业处理层
 
 包含 RepoAnalyzer、PDFAnalyzer、ResourceSearcher 等专业处理器
+
+导出按需加载，导入单个子模块时不会连带加载其他处理器。
 """
 
-from .repo_analyzer import RepoAnalyzer
-from .pdf_analyzer import PDFAnalyzer
-from .resource_searcher import ResourceSearcher
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .repo_analyzer import RepoAnalyzer
+    from .pdf_analyzer import PDFAnalyzer
+    from .resource_searcher import ResourceSearcher
+
+_EXPORTS = {
+    "RepoAnalyzer": ".repo_analyzer",
+    "PDFAnalyzer": ".pdf_analyzer",
+    "ResourceSearcher": ".resource_searcher",
+}
 
 __all__ = [
     "RepoAnalyzer",
     "PDFAnalyzer",
     "ResourceSearcher",
 ]
+
+
+def __getattr__(name: str):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -214,7 +214,7 @@ class PDFAnalyzer:
         
         Args:
             pdf_content: PDFContent 对象
-            rag_engine: RAGEngine 实例（可选，默认创建新的）
+            rag_engine: RAGEngine 实例（可选，默认复用 knowledge_base collection 的共享实例）
             
         Returns:
             导入的 chunk IDs
@@ -225,8 +225,8 @@ class PDFAnalyzer:
         >  然后调用这个方法把内容切分、向量化存入知识库。"
         """
         if rag_engine is None:
-            from src.rag import RAGEngine
-            rag_engine = RAGEngine()
+            from src.rag import get_rag_engine
+            rag_engine = get_rag_engine()
         
         # 准备文本内容
         text = self.to_learning_context(pdf_content)
@@ -143,34 +143,44 @@ class SearchOrchestrator:
                 if not PLATFORM_CONFIGS[p].requires_login and not PLATFORM_CONFIGS[p].use_api_search
             ]
 
-            # API 平台并发启动
+            # API 平台并发启动：用 create_task 立即调度，使其与下面登录平台的串行搜索重叠，
+            # 而不是等到 gather 时才开始执行
             api_tasks = [
-                self._search_single_platform(query, PLATFORM_CONFIGS[p], limit)
+                asyncio.create_task(self._search_single_platform(query, PLATFORM_CONFIGS[p], limit))
                 for p in api_platforms
             ]
 
-            # 需要登录的平台串行执行（可能触发浏览器重启）
-            for p in login_platforms:
-                try:
-                    config = PLATFORM_CONFIGS[p]
-                    result = await self._search_single_platform(query, config, limit)
-                    if result:
-                        all_raw.extend(result)
-                        logger.info(f"{p}: {len(result)} 条结果")
-                except Exception as e:
-                    logger.warning(f"平台 {p} 搜索失败: {e}")
-
-            # 收集 API 平台结果
-            if api_tasks:
-                api_results = await asyncio.gather(*api_tasks, return_exceptions=True)
-                for i, result in enumerate(api_results):
-                    platform_name = api_platforms[i]
-                    if isinstance(result, Exception):
-                        logger.warning(f"平台 {platform_name} 搜索失败: {result}")
-                        continue
-                    if result:
-                        all_raw.extend(result)
-                        logger.info(f"{platform_name}: {len(result)} 条结果")
+            try:
+                # 需要登录的平台串行执行（可能触发浏览器重启）
+                for p in login_platforms:
+                    try:
+                        config = PLATFORM_CONFIGS[p]
+                        result = await self._search_single_platform(query, config, limit)
+                        if result:
+                            all_raw.extend(result)
+                            logger.info(f"{p}: {len(result)} 条结果")
+                    except Exception as e:
+                        logger.warning(f"平台 {p} 搜索失败: {e}")
+
+                # 收集 API 平台结果
+                if api_tasks:
+                    api_results = await asyncio.gather(*api_tasks, return_exceptions=True)
+                    for i, result in enumerate(api_results):
+                        platform_name = api_platforms[i]
+                        if isinstance(result, Exception):
+                            logger.warning(f"平台 {platform_name} 搜索失败: {result}")
+                            continue
+                        if result:
+                            all_raw.extend(result)
+                            logger.info(f"{platform_name}: {len(result)} 条结果")
+            finally:
+                # 提前退出（异常或外层取消）时不留后台任务：未完成的取消，
+                # 已结束的读一下异常，避免 "Task exception was never retrieved"
+                for task in api_tasks:
+                    if not task.done():
+                        task.cancel()
+                    elif not task.cancelled():
+                        task.exception()
 
             # 不需要登录的浏览器平台并发执行（浏览器状态已稳定）
             if browser_platforms: